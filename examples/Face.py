@@ -60,30 +60,35 @@ sys.path.append('')  # See: https://github.com/micropython/micropython/issues/64
 import lvgl as lv
 import lv_colors as colors
 import math
+import micropython
+import uarray as array
 import utime as time
 
 lv.init()
 
+# Names used in the date label
+_WDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
 ##############################################################################
-# Helper debug function to print member name
+# Fixed point coordinates of the 12 hour positions of a dial
 ##############################################################################
 
-member_name_cache = {}
-
+# Sine of the hour positions (0, 30, ... 330 degrees) in Q15. The cosine of
+# an hour position is the sine three hours on, so the table continues to
+# 420 degrees and no cosine table or modulo (unsupported by viper) is needed
+_DEG2RAD = 0.017453292519943295  # pi / 180
+_SIN_Q15 = array.array('i', [int(math.sin(a * _DEG2RAD) * 32768) for a in range(0, 450, 30)])
 
-def get_member_name(obj, value):
-    try:
-        return member_name_cache[id(obj)][id(value)]
-    except KeyError:
-        pass
 
-    for member in dir(obj):
-        if getattr(obj, member) == value:
-            try:
-                member_name_cache[id(obj)][id(value)] = member
-            except KeyError:
-                member_name_cache[id(obj)] = {id(value): member}
-            return member
+@micropython.viper
+def _fill_ring(buf: ptr32, r: int):
+    # Store the 12 hour positions on a circle of radius r, relative to its
+    # centre, into buf as x0, y0, x1, y1, ...
+    sin = ptr32(_SIN_Q15)
+    for i in range(12):
+        buf[2 * i] = (sin[i] * r) >> 15
+        buf[2 * i + 1] = (sin[i + 3] * r) >> 15
 
 
 ##############################################################################
@@ -120,24 +125,62 @@ class FaceClass():
         else:
             self.card_font = lv.font_montserrat_16
         self.cardinal_labels = []
+        # Styles are created once and shared by every Face
+        self.date_style = lv.style_t()
+        self.date_style.init()
+        if not in_sim:
+            self.date_style.set_text_font(lv.font_montserrat_28)
+        else:
+            self.date_style.set_text_font(lv.font_montserrat_16)  # sim doesn't have additional fonts
+        self.date_style.set_text_color(lv.color_make(0xff,0xff,0x90))
+        self.lbl_style = lv.style_t()
+        self.lbl_style.init()
+        self.lbl_style.set_text_color(colors.lv_colors.WHITE)
         self.div_rounded = True
         self.sub_card_rounded = True
         self.cardinal_rounded = True
         self.div_col = colors.lv_colors.BLACK
         self.sub_card_col = colors.lv_colors.BLACK
         self.cardinal_col = colors.lv_colors.BLACK
-        self.card_points = []
-        self.sub_card_points = []
+        # All tick end points, sub cardinals first. The sub cardinal and cardinal
+        # lists share the same lv.point_t structs
+        self.dial_points = [(lv.point_t(), lv.point_t()) for i in range(FaceClass.HOURS)]
+        self.sub_card_points = self.dial_points[:FaceClass.HOURS - FaceClass.CARDINALS]
+        self.card_points = self.dial_points[FaceClass.HOURS - FaceClass.CARDINALS:]
+        self._obj = None  # Set by constructor
+        self._rebuild_tables()
+        self._line_dsc = lv.draw_line_dsc_t()
+        self._line_dsc.init()
+        self._line_dsc.opa = lv.OPA.COVER
+        self._line_dsc.width = FaceClass.TICK_WIDTH
+        self._line_dsc.round_start = True
+        self._line_dsc.round_end = True
         self.localtime = (1970, 1, 1, 22, 9, 26, 1, 1)
+        if not in_sim:
+            self.localtime = time.localtime()
         self.lastsync = time.ticks_ms()
         self.FRACTIONALTIMEZERO = time.ticks_diff(self.lastsync, self.lastsync)
         self.fractionaltime = self.FRACTIONALTIMEZERO
+        # Poll the RTC every frame until its first tick has been seen
+        self._synced = False
+        self._last_date_str = ""
         self.hour = Hand(main_rad=90, main_tail_rad=15, flag_rad=25, flag_end_rad=90)
         self.hour.flag_width = 14
         self.hour.spindle_rad = 8
         self.minute = Hand(main_rad=125, main_tail_rad=15, flag_rad=25, flag_end_rad=125)
         self.second = Hand(main_rad=155, main_tail_rad=15)
         self.second.color = colors.lv_colors.RED
+        self.hands = (self.hour, self.minute, self.second)
+        # (index into hand_rotations, hand, threshold) for update_hands
+        self._hand_thresholds = tuple(
+            (i, self.hands[i], FaceClass.HAND_THRESHOLDS[i]) for i in range(3))
+        self._hand_dsc = lv.draw_line_dsc_t()
+        self._hand_dsc.init()
+        self._hand_dsc.opa = lv.OPA.COVER
+        self._hand_dsc.round_start = True
+        self._hand_dsc.round_end = True
+        self._hand_area = lv.area_t()
+        self._new_hand_area = lv.area_t()
         #print("init complete!")
 
     def create(self, parent):
@@ -151,17 +194,12 @@ class FaceClass():
     def constructor(self, lv_cls, obj):
         # Initialize the custom widget instance
         obj.valid = False
+        # obj is the FaceWrapper, kept so that _rebuild_tables can invalidate it
+        self._obj = obj
         obj.add_flag(obj.FLAG.CLICKABLE)
         obj.clear_flag(obj.FLAG.SCROLLABLE)
-        date_style = lv.style_t()
-        date_style.init()
-        if not in_sim:
-            date_style.set_text_font(lv.font_montserrat_28)
-        else:
-            date_style.set_text_font(lv.font_montserrat_16)  # sim doesn't have additional fonts
-        date_style.set_text_color(lv.color_make(0xff,0xff,0x90))
         self.date = lv.label(obj.lv_obj)
-        self.date.add_style(date_style, lv.STATE.DEFAULT)
+        self.date.add_style(self.date_style, lv.STATE.DEFAULT)
         self.date.set_text("Thu 26 May")
         self.date.align(lv.ALIGN.CENTER, 0, 75)
         self.date.set_align(lv.ALIGN.CENTER)
@@ -171,20 +209,27 @@ class FaceClass():
     
     def init_cardinal_labels(self, obj):
         cardinals = ("6", "3", "12", "9")
-        lbl_style = lv.style_t()
-        lbl_style.init()
-        lbl_style.set_text_font(self.card_font)
-        lbl_style.set_text_color(colors.lv_colors.WHITE)
+        self.lbl_style.set_text_font(self.card_font)
         for cardinal in cardinals:
             lbl = lv.label(obj.lv_obj)
             lbl.set_text(cardinal)
-            lbl.add_style(lbl_style, lv.STATE.DEFAULT)
+            lbl.add_style(self.lbl_style, lv.STATE.DEFAULT)
             self.cardinal_labels.append(lbl)
+        self._align_cardinal_labels()
         #print("Cardinal labels initialised!")
 
     def destructor(self, lv_cls, obj):
         pass
 
+    # Events after which the widget parameters need recalculating
+    INVALIDATING_EVENTS = (
+        lv.EVENT.STYLE_CHANGED,
+        lv.EVENT.VALUE_CHANGED,
+        lv.EVENT.PRESSING,
+        lv.EVENT.RELEASED,
+        lv.EVENT.LAYOUT_CHANGED)
+
+    @micropython.native
     def event_cb(self, lv_cls, e):
         # Call the ancestor's event handler
         res = lv_cls.event_base(e)
@@ -194,8 +239,6 @@ class FaceClass():
         code = e.get_code()
         obj = e.get_target()
 
-        #print("Event %s" % get_member_name(lv.EVENT, code))
-
         if code == lv.EVENT.DRAW_MAIN:
             # Draw the widget
             draw_ctx = e.get_draw_ctx()
@@ -204,40 +247,26 @@ class FaceClass():
             # Draw the widget
             draw_ctx = e.get_draw_ctx()
             self.draw_hands(obj, draw_ctx)
-        if code == lv.EVENT.DRAW_MAIN:
-            # Draw the widget
-            draw_ctx = e.get_draw_ctx()
-            self.draw(obj, draw_ctx)
-        elif code in [
-            lv.EVENT.STYLE_CHANGED,
-            lv.EVENT.VALUE_CHANGED,
-            lv.EVENT.PRESSING,
-            lv.EVENT.RELEASED,
-            lv.EVENT.LAYOUT_CHANGED]:
+        elif code in FaceClass.INVALIDATING_EVENTS:
             # Check if need to recalculate widget parameters
             obj.valid = False
         elif code == lv.EVENT.REFRESH:
-            obj.invalidate()
+            self.update_hands(obj)
 
     def calc(self, obj):
         # Calculate object parameters
-        area = lv.area_t()
-        obj.get_content_coords(area)
-
-        obj.draw_desc = lv.draw_rect_dsc_t()
-        obj.draw_desc.init()
-        obj.draw_desc.bg_opa = lv.OPA.COVER;
-        obj.draw_desc.bg_color = obj.get_style_bg_color(lv.PART.MAIN)
-
-        obj.points = [
-            {'x': area.x1 + area.get_width() // 2,
-             'y': area.y2 if obj.get_state() & lv.STATE.CHECKED else area.y1},
-            {'x': area.x2,
-             'y': area.y1 + area.get_height() // 2},
-            {'x': area.x1,
-             'y': area.y1 + area.get_height() // 2},
-        ]
-        self.set_coords(obj)
+        # calc runs after style and state changes, so refresh the cached line
+        # colors of the dial and of hands without a color of their own here
+        color = obj.get_style_bg_color(lv.PART.MAIN)
+        self._line_dsc.color = color
+        for hand in self.hands:
+            hand.default_color = color
+
+        # The dial geometry only depends on the object's position and size
+        geom_key = (obj.get_x(), obj.get_y(), self.lv_cls.width_def, self.lv_cls.height_def)
+        if geom_key != self._geom_key:
+            self.set_coords(obj)
+            self._geom_key = geom_key
         obj.valid = True
 
     def draw(self, obj, draw_ctx):
@@ -245,82 +274,159 @@ class FaceClass():
         if not obj.valid:
             self.calc(obj)
 
-        # Draw the custom widget
-        # draw_ctx.polygon(obj.draw_desc, obj.points, len(obj.points))
-        draw_desc = lv.draw_line_dsc_t()
-        draw_desc.init()
-        draw_desc.opa = lv.OPA.COVER;
-        draw_desc.color = obj.get_style_bg_color(lv.PART.MAIN)
-        draw_desc.width = 10
-        draw_desc.round_start = True
-        draw_desc.round_end = True
-        for line in self.sub_card_points:
-            draw_ctx.line(draw_desc, line[0], line[1])
-        if self.card_font == None:
-            for line in self.card_points:
-                draw_ctx.line(draw_desc, line[0], line[1])
+        # Draw the custom widget. LVGL 8 has no polyline primitive to batch the
+        # ticks into, so instead skip all of them when the area being redrawn,
+        # usually just around the hands, lies inside the ring of ticks
+        clip = draw_ctx.clip_area
+        dx = max(abs(clip.x1 - self._centre_x), abs(clip.x2 - self._centre_x))
+        dy = max(abs(clip.y1 - self._centre_y), abs(clip.y2 - self._centre_y))
+        if dx * dx + dy * dy < self._tick_clear_rad2:
+            return
+        draw_desc = self._line_dsc
+        lines = self.dial_points if self.card_font == None else self.sub_card_points
+        for p0, p1 in lines:
+            draw_ctx.line(draw_desc, p0, p1)
 
+    @micropython.native
     def draw_hands(self, obj, draw_ctx):
+        # Hands are drawn where update_hands last rotated them, all with the
+        # same line descriptor
+        draw_desc = self._hand_dsc
+        for hand in self.hands:
+            hand.draw(obj, draw_ctx, draw_desc)
+
+    # Minimum movement, in tenths of a degree, before the hour, minute and
+    # second hands are redrawn
+    HAND_THRESHOLDS = (10, 5, 1)
+
+    @micropython.native
+    def update_hands(self, obj):
+        # Rotate the hands to the current time. Only hands that moved by at
+        # least their threshold are rotated, and only their old and new
+        # areas are invalidated rather than the whole Face
         if not in_sim:
             self.synchronise()
-        sec_rot = (self.localtime[5] * 6) + (6 * (self.fractionaltime/1000))
-        min_rot = (self.localtime[4] * 6) + (sec_rot / 60)
-        hr_rot = ((self.localtime[3] * 30) % 360) + (min_rot / 12)
-        self.hour.draw(obj, draw_ctx, 360 - hr_rot)
-        self.minute.draw(obj, draw_ctx, 360 - min_rot)
-        self.second.draw(obj, draw_ctx, 360 - sec_rot)
+        rots = self.hand_rotations()
+        if rots[2] == self.second.rotation:
+            # The minute and hour hands follow the second hand, so nothing moved
+            return
+        area = self._hand_area
+        new_area = self._new_hand_area
+        for i, hand, threshold in self._hand_thresholds:
+            rot = rots[i]
+            if abs(rot - hand.rotation) < threshold:
+                continue
+            hand.get_area(area)
+            hand.rotate(rot)
+            hand.get_area(new_area)
+            # The old and new positions mostly overlap, so invalidate their
+            # bounding box with a single call
+            area.x1 = min(area.x1, new_area.x1)
+            area.y1 = min(area.y1, new_area.y1)
+            area.x2 = max(area.x2, new_area.x2)
+            area.y2 = max(area.y2, new_area.y2)
+            obj.invalidate_area(area)
+
+    @micropython.native
+    def hand_rotations(self):
+        # Hour, minute and second hand angles in tenths of a degree, using
+        # integer arithmetic only
+        localtime = self.localtime
+        sec_rot = (localtime[5] * 60) + ((self.fractionaltime * 6) // 100)
+        min_rot = (localtime[4] * 60) + (sec_rot // 60)
+        hr_rot = ((localtime[3] % 12) * 300) + (min_rot // 12)
+        return (3600 - hr_rot, 3600 - min_rot, 3600 - sec_rot)
 
     CARDINALS = 4
     HOURS = 12
-
+    TICK_WIDTH = 10
+
+    def _rebuild_tables(self):
+        # Precompute the (outer x, outer y, inner x, inner y) offsets of the
+        # tick ends from the centre of the Face. Call again after changing
+        # any of the cardinal or sub cardinal radii or lengths; the Face is
+        # then recalculated and redrawn
+        outer = array.array('i', [0] * (2 * FaceClass.HOURS))
+        inner = array.array('i', [0] * (2 * FaceClass.HOURS))
+        _fill_ring(outer, self.cardinal_rad)
+        _fill_ring(inner, self.cardinal_rad - self.cardinal_len)
+        # Cardinals are at every third hour
+        self._card_tbl = tuple((outer[j], outer[j + 1], inner[j], inner[j + 1])
+                               for j in range(0, 2 * FaceClass.HOURS, 6))
+        _fill_ring(outer, self.sub_card_rad)
+        _fill_ring(inner, self.sub_card_rad - self.sub_card_len)
+        self._sub_card_tbl = tuple((outer[j], outer[j + 1], inner[j], inner[j + 1])
+                                   for j in range(0, 2 * FaceClass.HOURS, 2) if j % 6)
+        # Squared radius of the circle inside the ticks that no tick touches
+        clear_rad = min(self.cardinal_rad - self.cardinal_len,
+                        self.sub_card_rad - self.sub_card_len) - FaceClass.TICK_WIDTH // 2 - 1
+        self._tick_clear_rad2 = clear_rad * clear_rad
+        self._geom_key = None
+        self._align_cardinal_labels()
+        if self._obj is not None:
+            self._obj.valid = False
+            self._obj.invalidate()
+
+    def _align_cardinal_labels(self):
+        # The labels sit at the inner end of the cardinal ticks. They are
+        # aligned to the centre of the Face, so their offsets only depend on
+        # the radii and not on the Face position
+        for (a, b, c, d), label in zip(self._card_tbl, self.cardinal_labels):
+            label.align(lv.ALIGN.CENTER, c, d)
+
+    @micropython.native
     def set_coords(self, obj):
         x = obj.get_x() + int(self.lv_cls.width_def // 2)
         y = obj.get_y() + int(self.lv_cls.height_def // 2)
-        self.card_points.clear()
-        rotation = 0
-        for i in range(FaceClass.CARDINALS):
-            self.card_points.append([
-                {'x': x + int(math.sin(math.radians(rotation)) * self.cardinal_rad),
-                 'y': y + int(math.cos(math.radians(rotation)) * self.cardinal_rad)},
-                {'x': x + int(math.sin(math.radians(rotation)) * (self.cardinal_rad - self.cardinal_len)),
-                 'y': y + int(math.cos(math.radians(rotation)) * (self.cardinal_rad - self.cardinal_len))},
-            ])
-            rotation += 90
-        self.sub_card_points.clear()
-        rotation = 0
-        for i in range(FaceClass.HOURS):
-            rotation += 30
-            if (i % 3 == 2): continue
-            self.sub_card_points.append([
-                {'x': x + int(math.sin(math.radians(rotation)) * self.sub_card_rad),
-                 'y': y + int(math.cos(math.radians(rotation)) * self.sub_card_rad)},
-                {'x': x + int(math.sin(math.radians(rotation)) * (self.sub_card_rad - self.sub_card_len)),
-                 'y': y + int(math.cos(math.radians(rotation)) * (self.sub_card_rad - self.sub_card_len))},
-            ])
-        self.hour.set_coords(x, y)
-        self.minute.set_coords(x, y)
-        self.second.set_coords(x, y)
-        if self.card_font != None:
-            centre_x = obj.get_x() + int(self.lv_cls.width_def // 2)
-            centre_y = obj.get_y() + int(self.lv_cls.height_def // 2)
-            for line, label in list(zip(self.card_points, self.cardinal_labels)):
-                x = line[1]['x'] - centre_x
-                y =line[1]['y'] - centre_y
-                label.align(lv.ALIGN.CENTER, x, y)
-
+        self._centre_x = x
+        self._centre_y = y
+        for (a, b, c, d), (p0, p1) in zip(self._card_tbl, self.card_points):
+            p0.x = x + a
+            p0.y = y + b
+            p1.x = x + c
+            p1.y = y + d
+        for (a, b, c, d), (p0, p1) in zip(self._sub_card_tbl, self.sub_card_points):
+            p0.x = x + a
+            p0.y = y + b
+            p1.x = x + c
+            p1.y = y + d
+        for hand, rot in zip(self.hands, self.hand_rotations()):
+            hand.set_coords(x, y)
+            hand.rotate(rot)
+
+    # How long before the next second is due, in ms, to start polling the RTC
+    # every frame. Matches the refresh period so the tick is seen within a frame
+    SYNC_WINDOW_MS = 40
+
+    @micropython.native
     def synchronise(self):
+        # Advance the fraction of the current second with ticks_ms, and only
+        # read the RTC as the next second comes due
+        now = time.ticks_ms()
+        fraction = time.ticks_add(self.fractionaltime, time.ticks_diff(now, self.lastsync))
+        self.lastsync = now
+        if self._synced and fraction < 1000 - FaceClass.SYNC_WINDOW_MS:
+            self.fractionaltime = fraction
+            return
         lastsec = self.localtime[5]
         self.localtime = time.localtime()
-        fraction = time.ticks_ms()
-        if lastsec != self.localtime[5]:
-            self.fractionaltime = self.FRACTIONALTIMEZERO
+        if lastsec == self.localtime[5]:
+            # The RTC hasn't ticked yet, hold on the next second
+            self.fractionaltime = min(fraction, 1000)
+            return
+        # The RTC has ticked, re-lock the phase to it, carrying any overshoot
+        if fraction > 1000:
+            self.fractionaltime = fraction - 1000
         else:
-            self.fractionaltime = time.ticks_add(self.fractionaltime, time.ticks_diff(fraction, self.lastsync))
-        self.lastsync = fraction
-        date_str = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")[(self.localtime[6] + 1) % 7] # rp2 bug?
-        date_str += " " + str(self.localtime[2]) + " "
-        date_str += ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")[self.localtime[1] - 1]
-        self.date.set_text(date_str)
+            self.fractionaltime = self.FRACTIONALTIMEZERO
+        self._synced = True
+        date_str = "{} {} {}".format(
+            _WDAYS[(self.localtime[6] + 1) % 7], # rp2 bug?
+            self.localtime[2],
+            _MONTHS[self.localtime[1] - 1])
+        if date_str != self._last_date_str:
+            self.date.set_text(date_str)
+            self._last_date_str = date_str
 
 ##############################################################################
 # A Python class to wrap the LVGL custom widget
@@ -353,6 +459,18 @@ class Face():
             # Initalize the object
             self.lv_obj.class_init_obj()
 
+            # Bind frequently used LVGL object functions directly, bypassing
+            # __getattr__. The class callbacks receive this wrapper as obj,
+            # so this includes the functions they call on every REFRESH
+            self.align = self.lv_obj.align
+            self.add_style = self.lv_obj.add_style
+            self.add_event_cb = self.lv_obj.add_event_cb
+            self.invalidate = self.lv_obj.invalidate
+            self.invalidate_area = self.lv_obj.invalidate_area
+            self.get_x = self.lv_obj.get_x
+            self.get_y = self.lv_obj.get_y
+            self.get_style_bg_color = self.lv_obj.get_style_bg_color
+
         def __getattr__(self, attr):
             # Provide access to LVGL object functions
             # print("__getattr__(%s, %s)" % (repr(self), repr(attr)))
@@ -426,8 +544,12 @@ else:
     display = ili9486.display(wr=14, rd=12, rst=13, cs=27, dc=28, d0=15, backlight=11)
     display.init()
     draw_buf = lv.disp_draw_buf_t()
-    buf1_1 = bytearray(480 * 64)
-    buf1_2 = bytearray(480 * 64)
+    # Two draw buffers of 40 rows each. The display is rotated, so LVGL's rows
+    # are 480 pixels (ver_res) of 2 bytes. Each refresh only redraws the small
+    # areas around the hands that moved, so larger buffers would mostly sit
+    # unused
+    buf1_1 = bytearray(480 * 40 * 2)
+    buf1_2 = bytearray(480 * 40 * 2)
     size = len(buf1_1) // 2
     draw_buf.init(buf1_1, buf1_2, size)
     disp_drv = lv.disp_drv_t()
@@ -458,21 +580,24 @@ scr_style.init()
 scr_style.set_bg_color(colors.lv_colors.BLACK)
 scr.add_style(scr_style, lv.STATE.DEFAULT)
 
+# Button styles, shared by all the buttons
+btn_style = lv.style_t()
+btn_style.init()
+if not in_sim:
+    btn_style.set_text_font(lv.font_montserrat_28)
+else:
+    btn_style.set_text_font(lv.font_montserrat_16)
+btn_style.set_text_color(colors.lv_colors.WHITE)
+btn_style.set_text_opa(lv.OPA._40)
+btn_pressed_style = lv.style_t()
+btn_pressed_style.init()
+btn_pressed_style.set_text_opa(lv.OPA._70)
+
 # Add an alarm enable button
 def create_button(symbol, callback):
     btn = lv.label(scr)
     btn.set_text(symbol)
-    btn_style = lv.style_t()
-    btn_style.init()
-    if not in_sim:
-        btn_style.set_text_font(lv.font_montserrat_28)
-    else:
-        btn_style.set_text_font(lv.font_montserrat_16)
-    btn_style.set_text_color(colors.lv_colors.WHITE)
-    btn_style.set_text_opa(lv.OPA._40)
     btn.add_style(btn_style, lv.STATE.DEFAULT)
-    btn_pressed_style = lv.style_t()
-    btn_pressed_style.set_text_opa(lv.OPA._70)
     btn.add_style(btn_pressed_style, lv.STATE.PRESSED)
     btn.add_flag(lv.obj.FLAG.CLICKABLE);
     btn.add_event_cb(callback, lv.EVENT.CLICKED, None)
@@ -519,16 +644,38 @@ def df():
 
 if not in_sim:
     import gc, os
-    from machine import ADC, Pin
+    from machine import ADC, Pin, Timer
 
     adc = ADC(Pin(26))
     print(free(True))
     print(df())
 
-    while True:
+    # Drive the LVGL tick from a hardware timer, so it doesn't drift with the
+    # time spent drawing. The callback runs as a hard IRQ, as scheduled soft
+    # callbacks would be dropped during long draws; tick_inc doesn't allocate
+    tick_timer = Timer(period=1, mode=Timer.PERIODIC, callback=lambda t: lv.tick_inc(1), hard=True)
+
+    REFRESH_MS = 40
+
+    # Refresh the Face from an LVGL timer, run by task_handler every
+    # REFRESH_MS
+    def refresh(timer):
+        # Collect garbage once per frame, between drawing and the next
+        # refresh, so automatic collections rarely land mid-draw
+        gc.collect()
         display.backlight(adc.read_u16())
         touch.read()
-        lv.task_handler()
-        lv.tick_inc(40)
-        time.sleep_ms(40)
         lv.event_send(face, lv.EVENT.REFRESH, None)
+
+    refresh_timer = lv.timer_create(refresh, REFRESH_MS, None)
+
+    # The main loop, compiled to native code. It only runs the LVGL timers,
+    # sleeping in between. The default arguments bind the functions it calls
+    # to locals
+    @micropython.native
+    def run(task_handler=lv.task_handler, sleep_ms=time.sleep_ms):
+        while True:
+            task_handler()
+            sleep_ms(1)
+
+    run()
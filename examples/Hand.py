@@ -33,6 +33,22 @@ class HandPart():
 
 import lvgl as lv
 import math
+import micropython
+import uarray as array
+
+# Sine of every whole degree in Q15
+_DEG2RAD = 0.017453292519943295  # pi / 180
+_SIN_Q15 = array.array('h', (int(math.sin(d * _DEG2RAD) * 32767) for d in range(360)))
+
+
+@micropython.native
+def _sin_q15(angle):
+    # Sine of angle, in tenths of a degree between 0 and 3599, in Q15.
+    # Linearly interpolates between the whole degrees in the table
+    d = angle // 10
+    t = angle - d * 10  # Not divmod, which would allocate a tuple
+    s = _SIN_Q15[d]
+    return s + ((_SIN_Q15[(d + 1) % 360] - s) * t) // 10
 
 ##############################################################################
 # A class that describes a clock hand
@@ -51,40 +67,89 @@ class Hand():
         self.main_width = 4
         self.flag_width = 12
         self.color = None
-        self.spindle = {'x': x, 'y': y}
-        self.main = [{'x': 0, 'y': 0}, {'x': 0, 'y': 0}]
-        self.flag = [{'x': 0, 'y': 0}, {'x': 0, 'y': 0}]
+        self.default_color = None  # Used when color is None, set by the owner
+        self.rotation = 0
+        self._last_by = None  # Angle the points were last computed for
+        # Points are preallocated and updated in place by rotate/set_coords
+        self.spindle = lv.point_t({'x': x, 'y': y})
+        self.spindle_end = lv.point_t({'x': x + 1, 'y': y + 1})
+        self.main = [lv.point_t(), lv.point_t()]
+        self.flag = [lv.point_t(), lv.point_t()]
 
-    def draw(self, obj, draw_ctx, rotate_by):
-        self.rotate(rotate_by+180)
-        draw_desc = lv.draw_line_dsc_t()
-        draw_desc.init()
-        draw_desc.opa = lv.OPA.COVER;
-        if self.color == None:
-            draw_desc.color = obj.get_style_bg_color(lv.PART.MAIN)
-        else:
+    def draw(self, obj, draw_ctx, draw_desc):
+        # Draw the hand at the angle set by rotate(). draw_desc is an
+        # initialised lv.draw_line_dsc_t, shared between hands, whose color
+        # and width are overwritten here
+        if self.color != None:
             draw_desc.color = self.color
+        elif self.default_color != None:
+            draw_desc.color = self.default_color
+        else:
+            draw_desc.color = obj.get_style_bg_color(lv.PART.MAIN)
         draw_desc.width = self.main_width
-        draw_desc.round_start = True
-        draw_desc.round_end = True
         draw_ctx.line(draw_desc, self.main[0], self.main[1])
         if self.flag_rad != 0:
             draw_desc.width = self.flag_width
             draw_ctx.line(draw_desc, self.flag[0], self.flag[1])
         draw_desc.width = self.spindle_rad * 2
-        draw_ctx.line(draw_desc, self.spindle, {'x':self.spindle['x'] + 1, 'y':self.spindle['y'] + 1})       
+        draw_ctx.line(draw_desc, self.spindle, self.spindle_end)
 
+    @micropython.native
     def rotate(self, by):
-        self.main[0] = {'x': self.spindle['x'] - int(math.sin(math.radians(by)) * self.main_tail_rad),
-                        'y': self.spindle['y'] - int(math.cos(math.radians(by)) * self.main_tail_rad)}
-        self.main[1] = {'x': self.spindle['x'] + int(math.sin(math.radians(by)) * self.main_rad),
-                        'y': self.spindle['y'] + int(math.cos(math.radians(by)) * self.main_rad)}
+        # Rotate the hand to by tenths of a degree
+        self.rotation = by
+        if by == self._last_by:
+            return
+        self._last_by = by
+        # Look up sine and cosine (sine 90 degrees on) in the Q15 table
+        angle = (by + 1800) % 3600
+        s = _sin_q15(angle)
+        c = _sin_q15((angle + 900) % 3600)
+        sx = self.spindle.x
+        sy = self.spindle.y
+        p0, p1 = self.main
+        r = self.main_tail_rad
+        p0.x = sx - ((s * r) >> 15)
+        p0.y = sy - ((c * r) >> 15)
+        r = self.main_rad
+        p1.x = sx + ((s * r) >> 15)
+        p1.y = sy + ((c * r) >> 15)
+        if self.flag_rad != 0:
+            p0, p1 = self.flag
+            r = self.flag_rad
+            p0.x = sx + ((s * r) >> 15)
+            p0.y = sy + ((c * r) >> 15)
+            r = self.flag_end_rad
+            p1.x = sx + ((s * r) >> 15)
+            p1.y = sy + ((c * r) >> 15)
+
+    def get_area(self, area):
+        # Store the bounding box of the hand, including line widths, in area
+        spindle = self.spindle
+        start = self.main[0]
+        end = self.main[1]
+        x1 = min(spindle.x, start.x, end.x)
+        y1 = min(spindle.y, start.y, end.y)
+        x2 = max(spindle.x, start.x, end.x)
+        y2 = max(spindle.y, start.y, end.y)
+        pad = max(self.main_width, self.spindle_rad * 2)
         if self.flag_rad != 0:
-            self.flag[0] = {'x': self.spindle['x'] + int(math.sin(math.radians(by)) * self.flag_rad),
-                            'y': self.spindle['y'] + int(math.cos(math.radians(by)) * self.flag_rad)}
-            self.flag[1] = {'x': self.spindle['x'] + int(math.sin(math.radians(by)) * self.flag_end_rad),
-                            'y': self.spindle['y'] + int(math.cos(math.radians(by)) * self.flag_end_rad)}
+            flag_end = self.flag[1]
+            x1 = min(x1, flag_end.x)
+            y1 = min(y1, flag_end.y)
+            x2 = max(x2, flag_end.x)
+            y2 = max(y2, flag_end.y)
+            pad = max(pad, self.flag_width)
+        pad = pad // 2 + 1
+        area.x1 = x1 - pad
+        area.y1 = y1 - pad
+        area.x2 = x2 + pad
+        area.y2 = y2 + pad
 
     def set_coords(self, x, y):
-        self.spindle = {'x': x, 'y': y}
+        self._last_by = None  # Points must be recomputed around the new spindle
+        self.spindle.x = x
+        self.spindle.y = y
+        self.spindle_end.x = x + 1
+        self.spindle_end.y = y + 1
 